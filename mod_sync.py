@@ -3,10 +3,17 @@ import time
 import datetime
 import base64
 import json
+import sqlite3
+import zipfile
 import threading
 import traceback
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 import paramiko
 import customtkinter as ctk
+from tkinter import filedialog
 from PIL import Image
 from pathlib import Path
 
@@ -21,14 +28,24 @@ VERSION="v1.1.1"
 APPDATA_DIR = os.path.join(os.getenv('APPDATA'), 'MineSync')
 os.makedirs(APPDATA_DIR, exist_ok=True)
 REMEMBER_FILE = os.path.join(APPDATA_DIR, 'remember_me.json')
+VERIFY_CACHE_FILE = os.path.join(APPDATA_DIR, 'verify_cache.json')
+HISTORY_DB = os.path.join(APPDATA_DIR, 'sync_history.db')
+PROFILES_FILE = os.path.join(APPDATA_DIR, 'profiles.json')
 
 LOG_DIR = Path(os.path.join(APPDATA_DIR, "logs"))
 os.makedirs(LOG_DIR, exist_ok=True)  # Create logs directory if it doesn't exist
 LOG_FILE = LOG_DIR / f"session_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
 
-REMOTE_MODS_PATH = '/mods'
-LOCAL_MODS_PATH = os.path.join(os.getenv('APPDATA'), ".minecraft", "mods")
+DEFAULT_REMOTE_MODS_PATH = '/mods'
+DEFAULT_LOCAL_MODS_PATH = os.path.join(os.getenv('APPDATA'), ".minecraft", "mods")
+REMOTE_MODS_PATH = DEFAULT_REMOTE_MODS_PATH  # Switched when a profile is opened
+LOCAL_MODS_PATH = DEFAULT_LOCAL_MODS_PATH
 ASSET_PATH = Path(__file__).parent / "assets"
+LATEST_PAGE_SIZE = 25
+
+DOWNLOAD_WORKERS = 4  # Parallel SFTP connections per download run
+LARGE_MOD_SIZE = 20 * 1024 * 1024  # Mods at or above this stream in their own lane
+CHUNK_SIZE = 64 * 1024
 
 # === DEBUG LOGGING ===
 def debug(msg):
@@ -47,11 +64,389 @@ def manage_logs():
             old_log.unlink()
 
 # === SFTP UTILS ===
-def get_sftp():
-    transport = paramiko.Transport((SFTP_HOST, SFTP_PORT))
-    transport.connect(username=SFTP_USERNAME, password=SFTP_PASSWORD)
+def get_sftp(profile=None):
+    """Connect with the logged-in credentials, or with a saved profile's"""
+    if profile is None:
+        transport = paramiko.Transport((SFTP_HOST, SFTP_PORT))
+        transport.connect(username=SFTP_USERNAME, password=SFTP_PASSWORD)
+    else:
+        transport = paramiko.Transport((profile["host"], int(profile["port"])))
+        password = profile_password(profile)
+        if password is None:
+            raise ValueError(f"No saved password for profile {profile['name']}, log in to its server first")
+        transport.connect(username=profile["user"], password=password)
     return paramiko.SFTPClient.from_transport(transport)
 
+def profile_password(profile):
+    """Return a profile's saved password, or the logged-in one for the same account, or None"""
+    if profile.get("pass"):
+        return base64.b64decode(profile["pass"]).decode()
+    if (profile["host"], int(profile["port"]), profile["user"]) == (SFTP_HOST, SFTP_PORT, SFTP_USERNAME):
+        return SFTP_PASSWORD
+    return None
+
+def close_sftp(sftp):
+    transport = sftp.get_channel().get_transport()
+    sftp.close()
+    transport.close()
+
+def server_key(profile=None):
+    if profile is None:
+        return f"{SFTP_HOST}:{SFTP_PORT}{REMOTE_MODS_PATH}"
+    return f"{profile['host']}:{profile['port']}{profile['remote_path']}"
+
+def folder_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+# === SYNC HISTORY ===
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    taken_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_server_time ON snapshots (server, taken_at);
+CREATE TABLE IF NOT EXISTS snapshot_mods (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    name TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_snapshot_mods_time ON snapshot_mods (snapshot_id, mtime);
+CREATE TABLE IF NOT EXISTS syncs (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    folder TEXT NOT NULL DEFAULT '',
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    completed_at REAL NOT NULL
+);
+"""
+
+def open_history():
+    conn = sqlite3.connect(HISTORY_DB, timeout=10)
+    conn.executescript(HISTORY_SCHEMA)
+    # Syncs are tied to the local folder they brought up to date; older databases lack the column
+    if "folder" not in [row[1] for row in conn.execute("PRAGMA table_info(syncs)")]:
+        conn.execute("ALTER TABLE syncs ADD COLUMN folder TEXT NOT NULL DEFAULT ''")
+    conn.executescript("""
+        DROP INDEX IF EXISTS idx_syncs_server_time;
+        CREATE INDEX IF NOT EXISTS idx_syncs_folder_time ON syncs (server, folder, completed_at);
+    """)
+    return conn
+
+def latest_snapshot_id(conn, server):
+    row = conn.execute("SELECT id FROM snapshots WHERE server = ? ORDER BY taken_at DESC LIMIT 1", (server,)).fetchone()
+    return row[0] if row else None
+
+def record_snapshot(server, mods):
+    """
+    Store a remote listing of (name, mtime, size), reusing the latest snapshot if nothing changed.
+    History is optional, so database errors are logged and None is returned.
+    """
+    try:
+        with closing(open_history()) as conn, conn:
+            last_id = latest_snapshot_id(conn, server)
+            if last_id is not None:
+                last = set(conn.execute("SELECT name, mtime, size FROM snapshot_mods WHERE snapshot_id = ?", (last_id,)))
+                if last == set(mods):
+                    return last_id
+            snapshot_id = conn.execute("INSERT INTO snapshots (server, taken_at) VALUES (?, ?)", (server, time.time())).lastrowid
+            conn.executemany("INSERT INTO snapshot_mods (snapshot_id, name, mtime, size) VALUES (?, ?, ?, ?)",
+                             [(snapshot_id, *mod) for mod in mods])
+            debug(f"Recorded snapshot {snapshot_id} with {len(mods)} mods")
+            prune_history(conn, server)
+            return snapshot_id
+    except sqlite3.Error:
+        debug(f"[ERROR] record_snapshot: {traceback.format_exc()}")
+        return None
+
+def record_sync(server, folder):
+    """Mark the latest snapshot of server as successfully synced into folder (a folder_key)"""
+    try:
+        with closing(open_history()) as conn, conn:
+            snapshot_id = latest_snapshot_id(conn, server)
+            if snapshot_id is not None:
+                conn.execute("INSERT INTO syncs (server, folder, snapshot_id, completed_at) VALUES (?, ?, ?, ?)",
+                             (server, folder, snapshot_id, time.time()))
+                debug(f"Recorded sync of snapshot {snapshot_id} into {folder}")
+                prune_history(conn, server)
+    except sqlite3.Error:
+        debug(f"[ERROR] record_sync: {traceback.format_exc()}")
+
+def prune_history(conn, server):
+    """Keep only the newest sync of server per folder, the snapshots they refer to and the latest snapshot"""
+    params = {"server": server, "latest": latest_snapshot_id(conn, server)}
+    old_syncs = conn.execute(
+        """DELETE FROM syncs WHERE server = :server AND id NOT IN
+           (SELECT MAX(id) FROM syncs WHERE server = :server GROUP BY folder)""", params).rowcount
+    stale = """SELECT id FROM snapshots WHERE server = :server AND id != :latest
+               AND id NOT IN (SELECT snapshot_id FROM syncs WHERE server = :server)"""
+    conn.execute(f"DELETE FROM snapshot_mods WHERE snapshot_id IN ({stale})", params)
+    old_snapshots = conn.execute(f"DELETE FROM snapshots WHERE id IN ({stale})", params).rowcount
+    if old_syncs or old_snapshots:
+        debug(f"Pruned {old_syncs} old syncs and {old_snapshots} old snapshots")
+
+def query_changes(server, folder, limit, offset=0):
+    """
+    Return (rows, total, last_sync_time) where rows are (name, mtime, change) newest first.
+    Changes are between the snapshot last synced into folder and the latest one; without a sync every mod is listed.
+    """
+    with closing(open_history()) as conn:
+        current = latest_snapshot_id(conn, server)
+        if current is None:
+            return [], 0, None
+        last_sync = conn.execute("SELECT snapshot_id, completed_at FROM syncs WHERE server = ? AND folder = ? ORDER BY completed_at DESC LIMIT 1",
+                                 (server, folder)).fetchone()
+        if last_sync is None:
+            total = conn.execute("SELECT COUNT(*) FROM snapshot_mods WHERE snapshot_id = ?", (current,)).fetchone()[0]
+            rows = conn.execute("SELECT name, mtime, '' FROM snapshot_mods WHERE snapshot_id = ? ORDER BY mtime DESC LIMIT ? OFFSET ?",
+                                (current, limit, offset)).fetchall()
+            return rows, total, None
+
+        changes = """
+            SELECT c.name AS name, c.mtime AS mtime, CASE WHEN b.name IS NULL THEN 'Added' ELSE 'Updated' END AS change
+            FROM snapshot_mods c LEFT JOIN snapshot_mods b ON b.snapshot_id = :base AND b.name = c.name
+            WHERE c.snapshot_id = :cur AND (b.name IS NULL OR b.mtime != c.mtime OR b.size != c.size)
+            UNION ALL
+            SELECT b.name, b.mtime, 'Removed'
+            FROM snapshot_mods b LEFT JOIN snapshot_mods c ON c.snapshot_id = :cur AND c.name = b.name
+            WHERE b.snapshot_id = :base AND c.name IS NULL
+        """
+        params = {"cur": current, "base": last_sync[0], "limit": limit, "offset": offset}
+        total = conn.execute(f"SELECT COUNT(*) FROM ({changes})", params).fetchone()[0]
+        rows = conn.execute(f"{changes} ORDER BY mtime DESC LIMIT :limit OFFSET :offset", params).fetchall()
+        return rows, total, last_sync[1]
+
+# === TRANSFER SCHEDULER ===
+class TokenBucket:
+    """Global bytes-per-second limit shared by all download workers"""
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+def plan_transfers(remote_mods, local_dir, names, pinned=()):
+    """
+    Turn mod names into (priority, name, size) jobs from a (name, mtime, size) remote listing.
+    Pinned mods go first, then missing, outdated and up-to-date ones, smallest first within each group.
+    """
+    remote = {name: (mtime, size) for name, mtime, size in remote_mods}
+    jobs = []
+    for name in names:
+        if name not in remote:
+            debug(f"Skipping {name}, not on server")
+            continue
+        mtime, size = remote[name]
+        try:
+            st = os.stat(os.path.join(local_dir, name))
+            state = 2 if st.st_size == size and st.st_mtime >= mtime else 1
+        except FileNotFoundError:
+            state = 0
+        jobs.append(((0 if name in pinned else 1, state, size), name, size))
+    return jobs
+
+def unsynced_mods(remote_mods, local_dir):
+    """Return the names of remote mods that are missing or outdated in local_dir"""
+    jobs = plan_transfers(remote_mods, local_dir, [mod for mod, _, _ in remote_mods])
+    return [name for (_, state, _), name, _ in jobs if state != 2]
+
+class TransferScheduler:
+    """
+    Downloads jobs from plan_transfers in priority order over a small pool of SFTP connections.
+    Large mods get a dedicated lane so they stream in the background while small ones finish first.
+    """
+    def __init__(self, connect, remote_dir, local_dir, bucket=None, workers=DOWNLOAD_WORKERS):
+        self.connect = connect
+        self.remote_dir = remote_dir
+        self.local_dir = local_dir
+        self.bucket = bucket  # A TokenBucket shared by every scheduler in the same sync, or None
+        self.workers = max(1, workers)
+        self.lock = threading.Lock()
+
+    def run(self, jobs, on_progress=None):
+        """Download every job and return {mod_name: success}"""
+        self.small = deque(sorted(job for job in jobs if job[2] < LARGE_MOD_SIZE))
+        self.large = deque(sorted(job for job in jobs if job[2] >= LARGE_MOD_SIZE))
+        self.results = {}
+        self.total = len(jobs)
+        self.on_progress = on_progress
+
+        # One lane starts on large jobs; every lane takes the other queue once its own runs dry
+        lanes = [(self.small, self.large)] * (self.workers - 1 if self.large else self.workers)
+        if self.large:
+            lanes.append((self.large, self.small))
+        threads = [threading.Thread(target=self.worker, args=(queues,), daemon=True) for queues in lanes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.results
+
+    def next_job(self, queues):
+        with self.lock:
+            for queue in queues:
+                if queue:
+                    return queue.popleft()
+        return None
+
+    def worker(self, queues):
+        sftp = None
+        try:
+            while (job := self.next_job(queues)) is not None:
+                _, name, size = job
+                try:
+                    if sftp is None:
+                        sftp = self.connect()
+                    self.download(sftp, name, size)
+                    debug(f"Downloaded: {name}")
+                    ok = True
+                except Exception as e:
+                    debug(f"[ERROR] Failed to download {name}: {traceback.format_exc()}")
+                    if sftp is not None:
+                        close_sftp(sftp)  # Reconnect for the next job in case the session died
+                        sftp = None
+                    ok = False
+                with self.lock:
+                    self.results[name] = ok
+                    done = len(self.results)
+                if self.on_progress:
+                    self.on_progress(done, self.total, name)
+        finally:
+            if sftp is not None:
+                close_sftp(sftp)
+
+    def download(self, sftp, name, size):
+        local_path = os.path.join(self.local_dir, name)
+        part_path = local_path + ".part"
+        try:
+            with sftp.open(f"{self.remote_dir}/{name}", "rb") as remote_file, open(part_path, "wb") as local_file:
+                if self.bucket is None:
+                    remote_file.prefetch(size)  # Prefetching would read ahead of the rate limit
+                while chunk := remote_file.read(CHUNK_SIZE):
+                    if self.bucket is not None:
+                        self.bucket.consume(len(chunk))
+                    local_file.write(chunk)
+            os.replace(part_path, local_path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+# === INTEGRITY UTILS ===
+def check_jar(path):
+    """Test the CRC of every entry in a jar (runs in a worker process)"""
+    try:
+        with zipfile.ZipFile(path) as jar:
+            return path, "Corrupt" if jar.testzip() is not None else None
+    except OSError:
+        return path, "Unreadable"
+    except (zipfile.BadZipFile, EOFError, ValueError, RuntimeError, NotImplementedError):
+        return path, "Corrupt"
+
+def load_verify_cache():
+    if os.path.exists(VERIFY_CACHE_FILE):
+        try:
+            with open(VERIFY_CACHE_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            debug(f"[ERROR] load_verify_cache: {traceback.format_exc()}")
+    return {}
+
+def save_verify_cache(cache):
+    with open(VERIFY_CACHE_FILE, "w") as f:
+        json.dump(cache, f)
+
+def check_local_mods(folder):
+    """
+    Return {mod_name: (size, mtime, problem)} for every jar in folder, where problem is None for an intact jar.
+    Only files whose stat changed since the last run are re-checked.
+    """
+    cache = load_verify_cache()
+    results = {}
+    to_check = {}
+    for entry in os.scandir(folder):
+        if not entry.name.endswith(".jar") or not entry.is_file():
+            continue
+        st = entry.stat()
+        cached = cache.get(entry.path)
+        if cached and len(cached) == 3 and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            results[entry.name] = (st.st_size, st.st_mtime, cached[2])
+        else:
+            to_check[entry.path] = (entry.name, st)
+
+    if to_check:
+        debug(f"Checking {len(to_check)} changed mods ({len(results)} cached)")
+        with ProcessPoolExecutor() as pool:
+            for path, problem in pool.map(check_jar, to_check, chunksize=4):
+                name, st = to_check[path]
+                if problem != "Unreadable":  # Locked files are retried next time
+                    cache[path] = [st.st_size, st.st_mtime_ns, problem]
+                results[name] = (st.st_size, st.st_mtime, problem)
+
+    # Drop cache entries for files that no longer exist in this folder
+    for path in [p for p in cache if os.path.dirname(p) == folder and os.path.basename(p) not in results]:
+        del cache[path]
+    save_verify_cache(cache)
+    return results
+
+# === PROFILES ===
+def load_profiles():
+    """Return {profile name: profile}, each mapping a server and remote path to a local instance folder"""
+    if os.path.exists(PROFILES_FILE):
+        try:
+            with open(PROFILES_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            debug(f"[ERROR] load_profiles: {traceback.format_exc()}")
+    return {}
+
+def save_profiles(profiles):
+    with open(PROFILES_FILE, "w") as f:
+        json.dump(profiles, f, indent=2)
+
+def clear_profile_passwords():
+    """Forget the saved passwords of all profiles, keeping their servers and folders"""
+    profiles = load_profiles()
+    if [profile.pop("pass") for profile in profiles.values() if "pass" in profile]:
+        save_profiles(profiles)
+        debug("Cleared saved profile passwords")
+
+def sync_profile(profile, bucket=None, on_progress=None):
+    """
+    Download every missing or outdated mod of a profile over its own connection pool.
+    Returns {mod_name: success} and records a sync once the instance folder matches the server.
+    """
+    with get_sftp(profile) as sftp:
+        remote_mods = [(file.filename, file.st_mtime, file.st_size)
+                       for file in sftp.listdir_attr(profile["remote_path"]) if file.filename.endswith(".jar")]
+    key = server_key(profile)
+    record_snapshot(key, remote_mods)
+
+    local_dir = profile["local_path"]
+    os.makedirs(local_dir, exist_ok=True)
+    jobs = [job for job in plan_transfers(remote_mods, local_dir, [mod for mod, _, _ in remote_mods]) if job[0][1] != 2]
+    debug(f"Profile {profile['name']}: {len(jobs)} of {len(remote_mods)} mods to download")
+    if on_progress:
+        on_progress(0, len(jobs), None)
+
+    scheduler = TransferScheduler(lambda: get_sftp(profile), profile["remote_path"], local_dir, bucket)
+    results = scheduler.run(jobs, on_progress)
+
+    if all(results.values()) and remote_mods and not unsynced_mods(remote_mods, local_dir):
+        record_sync(key, folder_key(local_dir))
+    return results
+
 # === MAIN APPLICATION ===
 class MinecraftSyncApp:
     def __init__(self, master):
@@ -132,9 +527,9 @@ class MinecraftSyncApp:
         top_bar.pack(fill='x', padx=10, pady=5)
         
         # Connection info label
-        conn_info = ctk.CTkLabel(top_bar, text=f"Connected to: {SFTP_HOST}:{SFTP_PORT} \nBuild Version: {VERSION}",
-                                 text_color="aqua", font=("Yippes", 12, "bold"))
-        conn_info.pack(side='left', padx=5)
+        self.conn_info = ctk.CTkLabel(top_bar, text=f"Connected to: {SFTP_HOST}:{SFTP_PORT} \nBuild Version: {VERSION}",
+                                      text_color="aqua", font=("Yippes", 12, "bold"))
+        self.conn_info.pack(side='left', padx=5)
         
         # Logout button
         logout_btn = ctk.CTkButton(top_bar, text="Logout", width=80, 
@@ -149,18 +544,30 @@ class MinecraftSyncApp:
         self.tabs.add("Exceed Mods")
         self.tabs.add("Latest Mods")
         self.tabs.add("Useful Mods")
+        self.tabs.add("Profiles")
 
         self.compare_table = ctk.CTkScrollableFrame(self.tabs.tab("Comparison"))
         self.compare_table.pack(fill="both", expand=True)
         self.selected_mods = []
+        self.corrupt_mods = {}  # mod name -> reason, filled by Verify
+        self.pinned_mods = set()  # Right-click a row to download it first
 
         self.exceed_list = ctk.CTkScrollableFrame(self.tabs.tab("Exceed Mods"))
         self.exceed_list.pack(fill="both", expand=True)
 
+        latest_nav = ctk.CTkFrame(self.tabs.tab("Latest Mods"), fg_color="transparent")
+        latest_nav.pack(side='bottom', fill='x', pady=(5, 0))
+        ctk.CTkButton(latest_nav, text="< Prev", width=70,
+                      command=lambda: self.populate_latest(self.latest_page - 1, refresh=False)).pack(side='left', padx=5)
+        ctk.CTkButton(latest_nav, text="Next >", width=70,
+                      command=lambda: self.populate_latest(self.latest_page + 1, refresh=False)).pack(side='right', padx=5)
+        self.latest_page_label = ctk.CTkLabel(latest_nav, text="")
+        self.latest_page_label.pack(side='left', fill='x', expand=True)
+
         self.latest_list = ctk.CTkScrollableFrame(self.tabs.tab("Latest Mods"))
         self.latest_list.pack(fill="both", expand=True)
-        self.latest_mods = []
         self.latest_selected = []
+        self.latest_page = 0
 
         self.useful_mods_frame = ctk.CTkScrollableFrame(self.tabs.tab("Useful Mods"))
         self.useful_mods_frame.pack(fill="both", expand=True)
@@ -173,6 +580,8 @@ class MinecraftSyncApp:
         self.download_all_icon = ctk.CTkImage(dark_image=Image.open(ASSET_PATH / "download_all.png"), size=(20, 20))
         self.delete_all_icon = ctk.CTkImage(dark_image=Image.open(ASSET_PATH / "delete_all.png"), size=(20, 20))
 
+        self.build_profiles_tab(self.tabs.tab("Profiles"))
+
         # === Progress Bar ===
         self.progress_bar = ctk.CTkProgressBar(self.master)
         self.progress_bar.pack(fill='x', padx=10, pady=(0, 5))
@@ -197,6 +606,202 @@ class MinecraftSyncApp:
                       command=self.download_all).pack(side='left', padx=5)
         ctk.CTkButton(self.btn_frame, text="Delete All", image=self.delete_all_icon, compound='left', 
                       command=self.delete_all).pack(side='left', padx=5)
+        ctk.CTkButton(self.btn_frame, text="Verify", image=self.check_icon, compound='left', 
+                      command=self.verify_mods).pack(side='left', padx=5)
+        self.rate_limit_entry = ctk.CTkEntry(self.btn_frame, placeholder_text="Limit KB/s", width=90)
+        self.rate_limit_entry.pack(side='right', padx=5)
+
+    def build_profiles_tab(self, tab):
+        form = ctk.CTkFrame(tab, fg_color="transparent")
+        form.pack(side='bottom', fill='x', pady=(5, 0))
+        self.profile_name_entry = ctk.CTkEntry(form, placeholder_text="Profile name", width=120)
+        self.profile_name_entry.pack(side='left', padx=5)
+        self.profile_remote_entry = ctk.CTkEntry(form, placeholder_text="Remote mods path", width=120)
+        self.profile_remote_entry.pack(side='left', padx=5)
+        self.profile_remote_entry.insert(0, REMOTE_MODS_PATH)
+        self.profile_local_entry = ctk.CTkEntry(form, placeholder_text="Instance mods folder")
+        self.profile_local_entry.pack(side='left', padx=5, fill='x', expand=True)
+        self.profile_local_entry.insert(0, LOCAL_MODS_PATH)
+        ctk.CTkButton(form, text="Browse", width=70, command=self.browse_profile_folder).pack(side='left', padx=5)
+        ctk.CTkButton(form, text="Save Profile", width=90, command=self.save_current_profile).pack(side='left', padx=5)
+
+        ctk.CTkButton(tab, text="Sync Checked Profiles", image=self.sync_icon, compound='left',
+                      command=self.sync_profiles).pack(side='bottom', pady=5)
+
+        self.profiles_list = ctk.CTkScrollableFrame(tab)
+        self.profiles_list.pack(fill="both", expand=True)
+        self.profile_checks = {}
+        self.profile_status = {}
+        self.populate_profiles()
+
+    def populate_profiles(self):
+        for widget in self.profiles_list.winfo_children():
+            widget.destroy()
+        self.profile_checks.clear()
+        self.profile_status.clear()
+
+        for name, profile in sorted(load_profiles().items()):
+            frame = ctk.CTkFrame(self.profiles_list)
+            frame.pack(fill='x', padx=5, pady=2)
+
+            check = ctk.CTkCheckBox(frame, text=name, width=140)
+            check.pack(side='left', padx=10)
+            self.profile_checks[name] = check
+
+            detail = ctk.CTkLabel(frame, text=f"{server_key(profile)} -> {profile['local_path']}", anchor='w')
+            detail.pack(side='left', padx=10, fill='x', expand=True)
+
+            ctk.CTkButton(frame, text="Delete", width=60, fg_color="transparent", border_width=1,
+                          command=lambda n=name: self.delete_profile(n)).pack(side='right', padx=5)
+            ctk.CTkButton(frame, text="Open", width=60,
+                          command=lambda p=profile: self.open_profile(p)).pack(side='right', padx=5)
+
+            status = ctk.CTkLabel(frame, text="", width=90)
+            status.pack(side='right', padx=5)
+            self.profile_status[name] = status
+
+    def browse_profile_folder(self):
+        folder = filedialog.askdirectory(initialdir=self.profile_local_entry.get() or None)
+        if folder:
+            self.profile_local_entry.delete(0, 'end')
+            self.profile_local_entry.insert(0, os.path.normpath(folder))
+
+    def save_current_profile(self):
+        """Save the logged-in server with the entered paths as a named profile"""
+        name = self.profile_name_entry.get().strip()
+        remote_path = self.profile_remote_entry.get().strip().rstrip('/') or DEFAULT_REMOTE_MODS_PATH
+        local_path = self.profile_local_entry.get().strip()
+        if not name or not local_path:
+            self.show_error("Profile name and instance mods folder are required")
+            return
+
+        profiles = load_profiles()
+        profiles[name] = {
+            "name": name,
+            "host": SFTP_HOST,
+            "port": SFTP_PORT,
+            "user": SFTP_USERNAME,
+            "remote_path": remote_path,
+            "local_path": local_path
+        }
+        # Like the login, only keep the password on disk when Remember Me is on
+        if os.path.exists(REMEMBER_FILE):
+            profiles[name]["pass"] = base64.b64encode(SFTP_PASSWORD.encode()).decode()
+        save_profiles(profiles)
+        debug(f"Saved profile {name}: {server_key(profiles[name])} -> {local_path}")
+        self.profile_name_entry.delete(0, 'end')
+        self.populate_profiles()
+
+    def delete_profile(self, name):
+        profiles = load_profiles()
+        if profiles.pop(name, None) is not None:
+            save_profiles(profiles)
+            debug(f"Deleted profile {name}")
+        self.populate_profiles()
+
+    def open_profile(self, profile):
+        """Point the main views at a profile's server and instance folder"""
+        if self.thread_running:
+            return
+        password = profile_password(profile)
+        if password is None:
+            self.show_error(f"Log in to {profile['host']} as {profile['user']} to use profile {profile['name']}")
+            return
+        global SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD, REMOTE_MODS_PATH, LOCAL_MODS_PATH
+        SFTP_HOST = profile["host"]
+        SFTP_PORT = int(profile["port"])
+        SFTP_USERNAME = profile["user"]
+        SFTP_PASSWORD = password
+        REMOTE_MODS_PATH = profile["remote_path"]
+        LOCAL_MODS_PATH = profile["local_path"]
+        os.makedirs(LOCAL_MODS_PATH, exist_ok=True)
+        debug(f"Opened profile {profile['name']}")
+
+        self.corrupt_mods = {}
+        self.pinned_mods.clear()
+        self.master.title(f"Mine Server Sync - {profile['name']} ({SFTP_HOST}:{SFTP_PORT})")
+        self.conn_info.configure(text=f"Connected to: {SFTP_HOST}:{SFTP_PORT} ({profile['name']}) \nBuild Version: {VERSION}")
+        self.tabs.set("Comparison")
+        threading.Thread(target=self.load_mods_background, daemon=True).start()
+
+    def sync_profiles(self):
+        if self.thread_running:
+            return
+        profiles = load_profiles()
+        selected = [profiles[name] for name, check in self.profile_checks.items() if check.get() and name in profiles]
+        if not selected:
+            self.show_error("Check at least one profile to sync")
+            return
+
+        # Two profiles writing the same folder would race on the same .part files
+        folders = {}
+        for profile in selected:
+            folders.setdefault(folder_key(profile["local_path"]), []).append(profile["name"])
+        shared = [names for names in folders.values() if len(names) > 1]
+        if shared:
+            self.show_error(f"Profiles {', '.join(shared[0])} use the same mods folder, check only one of them")
+            return
+        locked = [profile["name"] for profile in selected if profile_password(profile) is None]
+        if locked:
+            self.show_error(f"No saved password for {', '.join(locked)}, log in to their servers first")
+            return
+
+        self.thread_running = True
+        self.rate_limit = self.get_rate_limit()
+        self.disable_all_buttons()
+        threading.Thread(target=self.threaded_sync_profiles, args=(selected,), daemon=True).start()
+
+    def threaded_sync_profiles(self, profiles):
+        """Sync every profile at once, each on its own thread and connection pool, with one combined progress bar"""
+        progress = {profile["name"]: (0, 0) for profile in profiles}
+        lock = threading.Lock()
+        bucket = TokenBucket(self.rate_limit) if self.rate_limit else None  # One limit across all profiles
+
+        def on_progress(name, done, total):
+            with lock:
+                progress[name] = (done, total)
+                all_done = sum(d for d, _ in progress.values())
+                all_total = sum(t for _, t in progress.values())
+            self.master.after(0, lambda: [
+                self.profile_status[name].configure(text=f"{done}/{total}") if name in self.profile_status else None,
+                self.update_progress(all_done / all_total if all_total else 1, all_done, all_total)
+            ])
+
+        def run(profile):
+            name = profile["name"]
+            try:
+                results = sync_profile(profile, bucket, lambda done, total, mod: on_progress(name, done, total))
+                failed = sum(1 for ok in results.values() if not ok)
+                status = f"{failed} failed" if failed else "Up to date"
+            except Exception as e:
+                debug(f"[ERROR] sync_profile {name}: {traceback.format_exc()}")
+                status = "Error"
+            self.master.after(0, lambda: self.profile_status[name].configure(text=status) if name in self.profile_status else None)
+            return status
+
+        try:
+            self.master.after(0, lambda: self.show_loading_overlay(f"Syncing {len(profiles)} profiles..."))
+            statuses = {}
+            threads = [threading.Thread(target=lambda p=profile: statuses.update({p["name"]: run(p)}), daemon=True)
+                       for profile in profiles]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            problems = [name for name, status in statuses.items() if status != "Up to date"]
+            if problems:
+                self.master.after(0, lambda: self.show_error(f"Problems syncing: {', '.join(problems)}"))
+            self.master.after(0, lambda: self.finish_progress(f"Synced {len(profiles) - len(problems)}/{len(profiles)} profiles"))
+        except Exception as e:
+            debug(f"[ERROR] threaded_sync_profiles: {traceback.format_exc()}")
+            self.master.after(0, lambda: self.show_error("Error syncing profiles"))
+        finally:
+            self.master.after(0, lambda: [
+                self.hide_loading_overlay(),
+                self.enable_all_buttons()
+            ])
+            self.thread_running = False
 
     def load_mods_background(self):
         self.disable_all_buttons()
@@ -205,14 +810,14 @@ class MinecraftSyncApp:
 
         remote_mods = self.list_remote_mods()
         local_mods = self.list_local_mods()
-        timestamps = self.get_remote_mod_timestamps()
+        self.get_remote_mod_timestamps()  # Records a history snapshot for the Latest tab
 
         self.master.after(0, lambda: self.sync_mods(remote_mods, local_mods))
         self.master.after(100, lambda: self.progress_label.configure(text="Populating exceed mods..."))
         self.master.after(100, lambda: self.populate_exceed(remote_mods, local_mods))
 
         self.master.after(200, lambda: self.progress_label.configure(text="Populating latest mods..."))
-        self.master.after(200, lambda: self.populate_latest(timestamps))
+        self.master.after(200, lambda: self.populate_latest(refresh=False))
 
         # Final cleanup
         self.master.after(400, lambda: [
@@ -239,15 +844,18 @@ class MinecraftSyncApp:
 
     def logout(self):
         # Clear all connection details
-        global SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD
+        global SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD, REMOTE_MODS_PATH, LOCAL_MODS_PATH
         SFTP_HOST = None
         SFTP_PORT = None
         SFTP_USERNAME = None
         SFTP_PASSWORD = None
+        REMOTE_MODS_PATH = DEFAULT_REMOTE_MODS_PATH
+        LOCAL_MODS_PATH = DEFAULT_LOCAL_MODS_PATH
         
         # Remove saved credentials
         if os.path.exists(REMEMBER_FILE):
             os.remove(REMEMBER_FILE)
+        clear_profile_passwords()
 
         # Close current window
         self.master.destroy()
@@ -283,32 +891,67 @@ class MinecraftSyncApp:
     def get_remote_mod_timestamps(self):
         try:
             with get_sftp() as sftp:
-                mods = [(file.filename, file.st_mtime) for file in sftp.listdir_attr(REMOTE_MODS_PATH) if file.filename.endswith(".jar")]
+                mods = [(file.filename, file.st_mtime, file.st_size) for file in sftp.listdir_attr(REMOTE_MODS_PATH) if file.filename.endswith(".jar")]
                 debug(f"Found {len(mods)} remote mod timestamps")
-                return sorted(mods, key=lambda x: x[1], reverse=True)
+            record_snapshot(server_key(), mods)
+            return mods
         except Exception as e:
             debug(f"[ERROR] get_remote_mod_timestamps: {traceback.format_exc()}")
             self.master.after(0, lambda: self.show_error("Something went wrong..."))
             return []
 
-    def download_mod(self, mod_name):
+    def get_remote_mod_stats(self):
         try:
             with get_sftp() as sftp:
-                remote_path = f"{REMOTE_MODS_PATH}/{mod_name}"
-                local_path = os.path.join(LOCAL_MODS_PATH, mod_name)
-                sftp.get(remote_path, local_path)
-                debug(f"Downloaded: {mod_name}")
-                return True
+                stats = {file.filename: (file.st_mtime, file.st_size) for file in sftp.listdir_attr(REMOTE_MODS_PATH) if file.filename.endswith(".jar")}
+                debug(f"Found {len(stats)} remote mod stats")
+                return stats
         except Exception as e:
-            error_msg = f"Failed to download {mod_name}"
-            debug(f"[ERROR] {error_msg}: {traceback.format_exc()}")
-            self.master.after(0, lambda: self.show_error(error_msg))
+            debug(f"[ERROR] get_remote_mod_stats: {traceback.format_exc()}")
+            self.master.after(0, lambda: self.show_error("Something went wrong..."))
+            return None
+
+    def get_rate_limit(self):
+        """Return the download limit in bytes per second, or None if unlimited"""
+        text = self.rate_limit_entry.get().strip()
+        if not text:
+            return None
+        try:
+            kbps = float(text)
+            if kbps <= 0:
+                raise ValueError("Limit must be positive")
+            return kbps * 1024
+        except ValueError:
+            self.show_error("Rate limit must be a positive number of KB/s, downloading unlimited")
+            return None
+
+    def run_transfers(self, names, remote_mods=None):
+        """Download names through a TransferScheduler and return True if all succeeded"""
+        remote_mods = remote_mods or self.get_remote_mod_timestamps()
+        jobs = plan_transfers(remote_mods, LOCAL_MODS_PATH, names, self.pinned_mods)
+        total = len(jobs)
+        if total == 0:
             return False
-        
+
+        bucket = TokenBucket(self.rate_limit) if self.rate_limit else None
+        scheduler = TransferScheduler(get_sftp, REMOTE_MODS_PATH, LOCAL_MODS_PATH, bucket)
+        results = scheduler.run(jobs, lambda done, total, name: self.master.after(
+            0, lambda p=done / total, i=done: self.update_progress(p, i, total)))
+
+        failed = [name for name, ok in results.items() if not ok]
+        for name, ok in results.items():
+            if ok:
+                self.corrupt_mods.pop(name, None)
+        if failed:
+            error_msg = f"Failed to download {failed[0]}" if len(failed) == 1 else f"Failed to download {len(failed)} mods"
+            self.master.after(0, lambda: self.show_error(error_msg))
+        return not failed
+
     def download_all(self):
         if self.thread_running:
             return
         self.thread_running = True
+        self.rate_limit = self.get_rate_limit()
         self.disable_all_buttons()
         threading.Thread(target=self.threaded_download_all, daemon=True).start()
 
@@ -316,6 +959,7 @@ class MinecraftSyncApp:
         if self.thread_running:
             return
         self.thread_running = True
+        self.rate_limit = self.get_rate_limit()
         self.disable_all_buttons()
         threading.Thread(target=self.threaded_download_latest, daemon=True).start()
 
@@ -323,22 +967,19 @@ class MinecraftSyncApp:
         if self.thread_running:
             return
         self.thread_running = True
+        self.rate_limit = self.get_rate_limit()
         self.disable_all_buttons()
         threading.Thread(target=self.threaded_download_selected, daemon=True).start()
 
     def threaded_download_all(self):
         try:
-            mods = self.list_remote_mods()
-            total = len(mods)
-            if total == 0:
+            remote_mods = self.get_remote_mod_timestamps()
+            if not remote_mods:
                 return
 
             self.master.after(0, lambda: self.show_loading_overlay("Downloading all mods..."))
-            for i, mod in enumerate(mods, start=1):
-                self.download_mod(mod)
-                percent = i / total
-                self.master.after(0, lambda p=percent, i=i: self.update_progress(p, i, total))
-
+            all_ok = self.run_transfers([mod for mod, _, _ in remote_mods], remote_mods)
+            self.record_sync_if_complete(all_ok)
             self.master.after(0, lambda: self.finish_progress("Finished Downloading"))
         except Exception as e:
             debug(f"[ERROR] threaded_download_all: {traceback.format_exc()}")
@@ -353,15 +994,21 @@ class MinecraftSyncApp:
 
     def threaded_download_latest(self):
         try:
-            total = len(self.latest_mods)
-            if total == 0:
+            # Every change since the last sync, not just the visible page (-1 means no LIMIT)
+            rows, _, _ = query_changes(server_key(), folder_key(LOCAL_MODS_PATH), -1)
+            remote_mods = self.get_remote_mod_timestamps()
+            if not remote_mods:
+                return
+            changed = [mod for mod, _, change in rows if change != "Removed"]
+            # Skip changes that are already up to date locally, e.g. fetched with Download Selected
+            mods = [name for (_, state, _), name, _ in plan_transfers(remote_mods, LOCAL_MODS_PATH, changed) if state != 2]
+            if not mods:
+                self.record_sync_if_complete(True)
+                self.master.after(0, lambda: self.finish_progress("Latest mods already downloaded"))
                 return
 
-            for i, (mod, _) in enumerate(self.latest_mods, start=1):
-                self.download_mod(mod)
-                percent = i / total
-                self.master.after(0, lambda p=percent, i=i: self.update_progress(p, i, total))
-
+            all_ok = self.run_transfers(mods, remote_mods)
+            self.record_sync_if_complete(all_ok)
             self.master.after(0, lambda: self.finish_progress("Finished Downloading"))
         except Exception as e:
             debug(f"[ERROR] threaded_download_latest: {traceback.format_exc()}")
@@ -372,15 +1019,11 @@ class MinecraftSyncApp:
 
     def threaded_download_selected(self):
         try:
-            total = len(self.selected_mods)
-            if total == 0:
+            if not self.selected_mods:
                 return
 
-            for i, mod in enumerate(self.selected_mods, start=1):
-                self.download_mod(mod)
-                percent = i / total
-                self.master.after(0, lambda p=percent, i=i: self.update_progress(p, i, total))
-
+            all_ok = self.run_transfers(list(self.selected_mods))
+            self.record_sync_if_complete(all_ok)
             self.master.after(0, lambda: self.finish_progress("Finished Downloading"))
         except Exception as e:
             debug(f"[ERROR] threaded_download_selected: {traceback.format_exc()}")
@@ -389,6 +1032,70 @@ class MinecraftSyncApp:
             self.master.after(0, self.enable_all_buttons)
             self.thread_running = False
 
+    def verify_mods(self):
+        if self.thread_running:
+            return
+        self.thread_running = True
+        self.disable_all_buttons()
+        threading.Thread(target=self.threaded_verify, daemon=True).start()
+
+    def threaded_verify(self):
+        try:
+            self.master.after(0, lambda: self.show_loading_overlay("Verifying mods..."))
+            remote_stats = self.get_remote_mod_stats()
+            if remote_stats is None:
+                return  # get_remote_mod_stats already showed the error
+            if not os.path.exists(LOCAL_MODS_PATH):
+                debug(f"Verify: mods folder {LOCAL_MODS_PATH} does not exist")
+                self.master.after(0, lambda: self.finish_progress("No local mods folder"))
+                return
+
+            local = check_local_mods(LOCAL_MODS_PATH)
+            corrupt = {}
+            for mod, (size, mtime, problem) in local.items():
+                if mod not in remote_stats:
+                    continue  # Client-only mod, shown under Exceed Mods
+                remote_mtime, remote_size = remote_stats[mod]
+                if size != remote_size and remote_mtime > mtime:
+                    corrupt[mod] = "Outdated"  # Replaced on the server since it was downloaded
+                elif size < remote_size:
+                    corrupt[mod] = "Truncated"
+                elif size != remote_size:
+                    corrupt[mod] = "Corrupt"
+                elif problem:
+                    corrupt[mod] = problem
+            for mod, reason in corrupt.items():
+                debug(f"Verify: {mod} is {reason.lower()}")
+            debug(f"Verified {len(local)} local mods, {len(corrupt)} need re-download")
+
+            self.corrupt_mods = corrupt
+            msg = f"{len(corrupt)} mods selected for re-download" if corrupt else "All mods verified"
+            self.master.after(0, lambda: [
+                self.sync_mods(sorted(remote_stats), sorted(local)),
+                self.finish_progress(msg)
+            ])
+        except Exception as e:
+            debug(f"[ERROR] threaded_verify: {traceback.format_exc()}")
+            self.master.after(0, lambda: self.show_error("Error verifying mods"))
+        finally:
+            self.master.after(0, lambda: [
+                self.hide_loading_overlay(),
+                self.enable_all_buttons()
+            ])
+            self.thread_running = False
+
+    def record_sync_if_complete(self, all_ok):
+        """A download run counts as a sync once no remote mod is missing or outdated locally"""
+        if not all_ok:
+            return
+        remote_mods = self.get_remote_mod_timestamps()
+        pending = unsynced_mods(remote_mods, LOCAL_MODS_PATH)
+        if remote_mods and not pending:
+            record_sync(server_key(), folder_key(LOCAL_MODS_PATH))
+            self.master.after(0, lambda: self.populate_latest(refresh=False))
+        else:
+            debug(f"Not recording sync, {len(pending)} mods still missing or outdated")
+
     def update_progress(self, percent, current, total):
         self.progress_bar.set(percent)
         self.progress_bar.configure(progress_color="#1f6aa5")
@@ -444,6 +1151,14 @@ class MinecraftSyncApp:
             target.append(mod)
             frame.configure(fg_color="#2a2a2a")
 
+    def toggle_pin(self, mod, label):
+        if mod in self.pinned_mods:
+            self.pinned_mods.remove(mod)
+            label.configure(text=mod)
+        else:
+            self.pinned_mods.add(mod)
+            label.configure(text=f"★ {mod}")
+
     def sync_mods(self, remote_mods=None, local_mods=None):
         for widget in self.compare_table.winfo_children():
             widget.destroy()
@@ -461,20 +1176,26 @@ class MinecraftSyncApp:
 
         mod = self.remote_mods_to_show[self._mod_index]
         exists = mod in self.local_mods_set
-        icon = self.check_icon if exists else self.cross_icon
+        damage = self.corrupt_mods.get(mod) if exists else None
+        icon = self.check_icon if exists and not damage else self.cross_icon
 
         frame = ctk.CTkFrame(self.compare_table)
         frame.pack(fill='x', pady=1, padx=5)
         frame.mod_name = mod
 
-        name_label = ctk.CTkLabel(frame, text=mod)
+        name_label = ctk.CTkLabel(frame, text=f"★ {mod}" if mod in self.pinned_mods else mod)
         name_label.pack(side='left', padx=10)
 
-        icon_label = ctk.CTkLabel(frame, image=icon, text='')
+        icon_label = ctk.CTkLabel(frame, image=icon, text=damage or '', compound='left')
         icon_label.pack(side='right', padx=10)
 
+        if damage:
+            name_label.configure(text_color="orange")
+            self.on_row_click(mod, frame, self.selected_mods)  # Preselect for re-download
+
         for widget in [frame, name_label, icon_label]:
             widget.bind("<Button-1>", lambda e, m=mod, f=frame: self.on_row_click(m, f, self.selected_mods))
+            widget.bind("<Button-3>", lambda e, m=mod, l=name_label: self.toggle_pin(m, l))
 
         self._mod_index += 1
         self.master.after(20, self.show_next_mod)  # 20ms delay per row
@@ -491,19 +1212,35 @@ class MinecraftSyncApp:
             label = ctk.CTkLabel(self.exceed_list, text=mod)
             label.pack(anchor='w', padx=10, pady=2)
 
-    def populate_latest(self, timestamps=None):
-        self.latest_mods = (timestamps or self.get_remote_mod_timestamps())[:10]
+    def populate_latest(self, page=0, refresh=True):
+        if refresh:
+            self.get_remote_mod_timestamps()
+        try:
+            rows, total, last_sync = query_changes(server_key(), folder_key(LOCAL_MODS_PATH), LATEST_PAGE_SIZE, max(page, 0) * LATEST_PAGE_SIZE)
+        except sqlite3.Error:
+            debug(f"[ERROR] populate_latest: {traceback.format_exc()}")
+            self.show_error("Could not read sync history")
+            return
+        pages = max(1, -(-total // LATEST_PAGE_SIZE))
+        if page >= pages and page > 0:
+            return self.populate_latest(pages - 1, refresh=False)
+        self.latest_page = max(page, 0)
 
         for widget in self.latest_list.winfo_children():
             widget.destroy()
         self.latest_selected.clear()
 
-        for mod, ts in self.latest_mods:
+        if last_sync is None:
+            since = "No sync recorded yet"
+        else:
+            since = f"{total} changes since last sync ({datetime.datetime.fromtimestamp(last_sync).strftime('%Y-%m-%d %H:%M')})"
+        self.latest_page_label.configure(text=f"{since} - Page {self.latest_page + 1}/{pages}")
+
+        for mod, ts, change in rows:
             dt = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
 
             frame = ctk.CTkFrame(self.latest_list)
             frame.pack(fill='x', padx=5, pady=2)
-            frame.mod_name = mod
 
             label = ctk.CTkLabel(frame, text=f"{mod}", anchor='w')
             label.pack(side='left', padx=10, fill='x', expand=True)
@@ -511,7 +1248,16 @@ class MinecraftSyncApp:
             date_label = ctk.CTkLabel(frame, text=dt, anchor='e', width=120)
             date_label.pack(side='right', padx=10)
 
-            for widget in [frame, label, date_label]:
+            change_label = ctk.CTkLabel(frame, text=change, anchor='e', width=70,
+                                        text_color={"Added": "green", "Removed": "red"}.get(change, "orange"))
+            change_label.pack(side='right', padx=5)
+
+            if change == "Removed":  # Listed for reference but can't be downloaded
+                label.configure(text_color="gray")
+                continue
+
+            frame.mod_name = mod
+            for widget in [frame, label, date_label, change_label]:
                 widget.bind("<Button-1>", lambda e, m=mod, f=frame: self.on_row_click(m, f, self.latest_selected))
 
     def disable_all_buttons(self):
@@ -717,6 +1463,7 @@ def try_auto_login():
 
 # === MAIN ===
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Required for the verify process pool in the PyInstaller build
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("dark-blue")
     